@@ -14,7 +14,9 @@ This adapter customizes complex-expr-parser for complexity analysis:
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Mapping
 
 from sympy import (
     Abs,
@@ -33,7 +35,8 @@ from sympy import (
 from sympy.parsing.sympy_parser import (
     convert_xor,
     function_exponentiation,
-    implicit_multiplication_application,
+    implicit_application,
+    implicit_multiplication,
     parse_expr,
     standard_transformations,
 )
@@ -48,6 +51,15 @@ n: Symbol = Symbol("n", positive=True, integer=True)
 # Golden ratio for Fibonacci complexity
 phi = (1 + sqrt(5)) / 2
 
+# Preprocessing patterns, compiled once
+_RE_LN = re.compile(r"\bln\b")
+_RE_LOG2 = re.compile(r"\blog2\b")
+_RE_ABS = re.compile(r"\|([^|]+)\|")
+_RE_CEIL = re.compile(r"\bceil\b")
+_RE_NUMVAR = re.compile(r"(\d)([a-zA-Z])(?!\*\*)")
+_RE_LOGPOW = re.compile(r"log\^(\d+)\(n\)")
+_RE_NLOG = re.compile(r"n\s*\*\s*log")
+
 
 class ComplexityParser:
     """
@@ -66,30 +78,35 @@ class ComplexityParser:
         n**2 + n*log(n)
     """
 
+    _TRANSFORMATIONS = (
+        standard_transformations
+        + (implicit_multiplication, implicit_application, convert_xor, function_exponentiation)
+    )
+
+    _LOCAL_DICT: Mapping[str, Any] = MappingProxyType({
+        "n": n,
+        "pi": pi,
+        "oo": oo,
+        "phi": phi,
+        "log": log,
+        "ln": log,
+        "sqrt": sqrt,
+        "exp": exp,
+        "Abs": Abs,
+        "abs": Abs,
+        "factorial": factorial,
+        "floor": floor,
+        "ceiling": ceiling,
+        "ceil": ceiling,
+        "binomial": binomial,
+    })
+
     def __init__(self) -> None:
         """Initialize the parser with complexity-specific transformations."""
-        self.transformations = (
-            standard_transformations
-            + (implicit_multiplication_application, convert_xor, function_exponentiation)
-        )
-
-        self.local_dict: dict[str, Any] = {
-            "n": n,
-            "pi": pi,
-            "oo": oo,
-            "phi": phi,
-            "log": log,
-            "ln": log,
-            "sqrt": sqrt,
-            "exp": exp,
-            "Abs": Abs,
-            "abs": Abs,
-            "factorial": factorial,
-            "floor": floor,
-            "ceiling": ceiling,
-            "ceil": ceiling,
-            "binomial": binomial,
-        }
+        # The transformation tuple is immutable and shared; the namespace is
+        # copied so instances can customize it independently.
+        self.transformations = self._TRANSFORMATIONS
+        self.local_dict: dict[str, Any] = dict(self._LOCAL_DICT)
 
     def preprocess(self, expr_str: str) -> str:
         """
@@ -115,24 +132,24 @@ class ComplexityParser:
         result = result.replace("^", "**")
 
         # Normalize log functions
-        result = re.sub(r"\bln\b", "log", result)
-        result = re.sub(r"\blog2\b", "log", result)  # log2 → log (base doesn't matter for Big-O)
+        result = _RE_LN.sub("log", result)
+        result = _RE_LOG2.sub("log", result)  # log2 → log (base doesn't matter for Big-O)
 
         # Handle absolute value: |n| → Abs(n)
-        result = re.sub(r"\|([^|]+)\|", r"Abs(\1)", result)
+        result = _RE_ABS.sub(r"Abs(\1)", result)
 
         # Handle common aliases
-        result = re.sub(r"\bceil\b", "ceiling", result)
+        result = _RE_CEIL.sub("ceiling", result)
 
         # Ensure proper multiplication between number and variable
         # 2n → 2*n, but don't break 2**n
-        result = re.sub(r"(\d)([a-zA-Z])(?!\*\*)", r"\1*\2", result)
+        result = _RE_NUMVAR.sub(r"\1*\2", result)
 
         # Handle log^k(n) → log(n)**k
-        result = re.sub(r"log\^(\d+)\(n\)", r"log(n)**\1", result)
+        result = _RE_LOGPOW.sub(r"log(n)**\1", result)
 
         # Handle n*log(n) pattern - ensure space doesn't cause issues
-        result = re.sub(r"n\s*\*\s*log", "n*log", result)
+        result = _RE_NLOG.sub("n*log", result)
 
         return result
 
@@ -160,32 +177,32 @@ class ComplexityParser:
         processed = self.preprocess(expr_str)
 
         errors: list[str] = []
+        transformed: Expr | None = None
 
-        # Attempt 1: Direct sympify
+        # Attempt 1: parse_expr with transformations (handles the common case)
         try:
-            expr = sympify(processed, locals=self.local_dict)
-            return expr
-        except Exception as e:
-            errors.append(f"Sympify: {e}")
-
-        # Attempt 2: parse_expr with transformations
-        try:
-            expr = parse_expr(
+            transformed = parse_expr(
                 processed,
                 local_dict=self.local_dict,
                 transformations=self.transformations,
             )
-            return expr
+            # Implicit multiplication reads unknown calls like f(n) as f*n;
+            # only trust it outright when no new symbols were introduced
+            known = set(self.local_dict.values())
+            if not any(s not in known for s in transformed.free_symbols):
+                return transformed
         except Exception as e:
             errors.append(f"Parse_expr: {e}")
 
-        # Attempt 3: Original with minimal preprocessing
+        # Attempt 2: Direct sympify for inputs the transformations reject
+        # or misread
         try:
-            basic = expr_str.replace("^", "**")
-            expr = sympify(basic, locals=self.local_dict)
+            expr = sympify(processed, locals=self.local_dict)
             return expr
         except Exception as e:
-            errors.append(f"Basic: {e}")
+            if transformed is not None:
+                return transformed
+            errors.append(f"Sympify: {e}")
 
         raise ValueError(
             f"Could not parse complexity expression: '{original}'\n"
@@ -194,7 +211,24 @@ class ComplexityParser:
         )
 
 
-def parse_complexity(expr_str: str) -> Expr:
+# Shared parser used by the module-level convenience functions
+_DEFAULT_PARSER = ComplexityParser()
+
+
+@lru_cache(maxsize=1024)
+def _cached_parse(expr_str: str) -> Expr:
+    """
+    Parse an expression string, memoized on the raw input.
+
+    SymPy expressions are immutable, so handing out the same instance to
+    every caller is safe. Failed parses raise and are not cached. Only the
+    module-level functions use this; ComplexityParser.parse always runs with
+    the instance's own preprocess and local_dict.
+    """
+    return _DEFAULT_PARSER.parse(expr_str)
+
+
+def parse_complexity(expr_str: str, target_var: Symbol | None = None) -> Expr:
     """
     Parse a complexity expression string into a SymPy expression.
 
@@ -202,9 +236,12 @@ def parse_complexity(expr_str: str) -> Expr:
 
     Args:
         expr_str: Human-friendly complexity string (e.g., "n^2", "n*log(n)").
+        target_var: Symbol to use in place of 'n', e.g. one with different
+            assumptions. The substituted result is cached as well, and no
+            substitution happens when it equals this module's 'n'.
 
     Returns:
-        A SymPy expression with 'n' as the variable.
+        A SymPy expression with 'n' (or target_var) as the variable.
 
     Example:
         >>> parse_complexity("n^2 + n")
@@ -212,8 +249,15 @@ def parse_complexity(expr_str: str) -> Expr:
         >>> parse_complexity("O(n*log(n))")
         n*log(n)
     """
-    parser = ComplexityParser()
-    return parser.parse(expr_str)
+    if target_var is None or target_var == n:
+        return _cached_parse(expr_str)
+    return _cached_parse_as(expr_str, target_var)
+
+
+@lru_cache(maxsize=1024)
+def _cached_parse_as(expr_str: str, target_var: Symbol) -> Expr:
+    """Cached parse with 'n' replaced by target_var."""
+    return _cached_parse(expr_str).subs(n, target_var)
 
 
 def validate_complexity(expr_str: str) -> tuple[bool, str | None]:
@@ -237,8 +281,7 @@ def validate_complexity(expr_str: str) -> tuple[bool, str | None]:
         return False, "Expression cannot be empty"
 
     try:
-        parser = ComplexityParser()
-        _ = parser.parse(expr_str)
+        _ = _cached_parse(expr_str)
         return True, None
     except Exception as e:
         return False, str(e)
@@ -247,6 +290,15 @@ def validate_complexity(expr_str: str) -> tuple[bool, str | None]:
 # For compatibility with complex-expr-parser API
 try:
     from complex_expr_parser import ComplexFunctionParser
+    from sympy import symbols
+
+    _Z = symbols("z", complex=True)
+
+    @lru_cache(maxsize=1)
+    def _complex_parser() -> "ComplexFunctionParser":
+        """Build the fallback parser on first use, so a failing
+        constructor only affects inputs that actually need it."""
+        return ComplexFunctionParser()
 
     class HybridComplexityParser(ComplexityParser):
         """
@@ -266,12 +318,8 @@ try:
 
             # Fallback: use complex-expr-parser with z→n substitution
             try:
-                complex_parser = ComplexFunctionParser()
                 z_expr_str = expr_str.replace("n", "z")
-                z_expr = complex_parser.parse(z_expr_str)
-                from sympy import symbols
-                z = symbols("z", complex=True)
-                return z_expr.subs(z, n)
+                return _complex_parser().parse(z_expr_str).subs(_Z, n)
             except Exception as e:
                 raise ValueError(
                     f"Could not parse '{expr_str}' with any strategy: {e}"
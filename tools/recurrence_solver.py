@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uv run --script
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["sympy>=1.12", "complex-expr-parser>=0.1.0"]
+# dependencies = ["sympy>=1.12", "complex-expr-parser>=0.1.0", "numpy>=1.24"]
 # ///
 """
 Recurrence relation solver using SymPy.
@@ -14,6 +14,15 @@ Uses sympy.limit() for proper asymptotic analysis, which handles:
 Usage:
     echo '{"type": "linear", "coeffs": [1, 1], "base": {"0": 0, "1": 1}}' | uv run tools/recurrence_solver.py
 
+Successful results are cached on disk under $XDG_CACHE_HOME/recurrence_solver
+(default ~/.cache/recurrence_solver), keyed on the request and this tool's
+source, so repeated identical requests skip solving. Set
+RECURRENCE_SOLVER_NO_CACHE=1 to disable.
+
+Set RECURRENCE_SOLVER_WORKERS=N (N > 1) to evaluate the fallback candidate
+limits of extract_complexity in a pool of N processes. This only pays off for
+long-lived callers: a one-shot CLI run spends more starting workers than it saves.
+
 Input JSON schema:
 {
     "type": "linear" | "divide_conquer" | "verify" | "compare",
@@ -22,6 +31,7 @@ Input JSON schema:
     "coeffs": [c0, c1, ...],      # coefficients for T(n-1), T(n-2), ...
     "base": {"0": val0, "1": val1, ...},  # base cases T(0)=val0, T(1)=val1
     "f_n": "n" | "n**2" | "1" | ...,  # non-homogeneous term (optional, default "0")
+    "simplify": false,            # also return "simplified_form" (optional, slow)
 
     # For divide_conquer: T(n) = a*T(n/b) + f(n)
     "a": 2,           # number of subproblems
@@ -60,19 +70,22 @@ Asymptotic Comparison (for "compare" type):
 }
 """
 
+import atexit
+import hashlib
 import json
+import math
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from sympy import (
-    Symbol, Function, Rational, sqrt, log, oo, O as BigO,
-    symbols, simplify, expand, factor, nsimplify,
-    rsolve, limit, Abs, floor, ceiling, Pow, Add, Mul,
-    fibonacci, lucas, binomial, factorial,
-    sympify, latex, N, zoo, nan, I
+    Symbol, Function, Rational, Integer, sqrt, log, oo, Order,
+    simplify, cancel, expand, expand_func, expand_log, nsimplify, powdenest, powsimp,
+    limit, Abs, Pow, Mul, factorial,
+    sympify, zoo, srepr, lambdify, I
 )
-from sympy.core.numbers import Float
 
 # Import the complexity adapter for human-friendly expression parsing
 # This handles notation like "n^2", "n*log(n)", "O(n^2)"
@@ -85,9 +98,26 @@ except ImportError:
     HAS_ADAPTER = False
     complexity_n = Symbol('n', positive=True, integer=True)
 
-    def parse_complexity(expr_str: str):
+    def parse_complexity(expr_str: str, target_var=None):
         """Fallback parser when adapter is not available."""
-        return sympify(expr_str.replace("^", "**"), locals={"n": complexity_n})
+        return sympify(
+            expr_str.replace("^", "**"), locals={"n": target_var or complexity_n}
+        )
+
+
+# Solver variables, created once: integer n for exact recurrences,
+# real n for divide-and-conquer sizes n/b
+_N_INT = Symbol('n', integer=True, positive=True)
+_N_REAL = Symbol('n', positive=True, real=True)
+_T = Function('T')
+
+# Optional process pool for the fallback candidate limits (see
+# _match_candidate_class); created on first use
+try:
+    _LIMIT_WORKERS = int(os.environ.get("RECURRENCE_SOLVER_WORKERS") or 0)
+except ValueError:
+    _LIMIT_WORKERS = 0
+_limit_pool = None
 
 
 def solve_linear_recurrence(data: dict) -> dict:
@@ -96,8 +126,8 @@ def solve_linear_recurrence(data: dict) -> dict:
 
     Example: Fibonacci is coeffs=[1,1], base={0:0, 1:1}, f_n="0"
     """
-    n = Symbol('n', integer=True, positive=True)
-    T = Function('T')
+    n = _N_INT
+    T = _T
 
     coeffs = data.get("coeffs", [1])
     base_cases = data.get("base", {"0": 0})
@@ -105,7 +135,7 @@ def solve_linear_recurrence(data: dict) -> dict:
 
     try:
         # Use the complexity adapter for human-friendly notation
-        f_n = parse_complexity(f_n_str).subs(complexity_n, n)
+        f_n = parse_complexity(f_n_str, target_var=n)
     except Exception as e:
         return {"success": False, "error": f"Invalid f(n): {e}"}
 
@@ -115,24 +145,31 @@ def solve_linear_recurrence(data: dict) -> dict:
         recurrence_eq -= c * T(n - 1 - i)
 
     # Convert base cases to sympy format: {T(0): 0, T(1): 1, ...}
+    # Plain JSON integers skip sympify's type dispatch
     init_conds = {}
     for k, v in base_cases.items():
-        init_conds[T(int(k))] = sympify(v)
+        init_conds[T(int(k))] = Integer(v) if type(v) is int else sympify(v)
+
+    from sympy import rsolve
 
     try:
         solution = rsolve(recurrence_eq, T(n), init_conds)
         if solution is None:
             return {"success": False, "error": "rsolve returned None - recurrence may be unsolvable"}
 
-        solution = simplify(solution)
+        # rsolve output is already a usable closed form; the full simplify()
+        # pass is often the slowest step, so only run it on request
+        simplified = simplify(solution) if data.get("simplify", False) else None
 
         # Extract asymptotic complexity
         complexity = extract_complexity(solution, n)
 
         # Verify solution satisfies recurrence for a few values
-        verified = verify_solution_numerically(solution, n, recurrence_eq, T, init_conds)
+        verified = verify_solution_numerically(solution, n, coeffs, f_n, init_conds)
 
-        return {
+        from sympy import latex
+
+        result = {
             "success": True,
             "closed_form": str(solution),
             "complexity": complexity,
@@ -140,6 +177,9 @@ def solve_linear_recurrence(data: dict) -> dict:
             "verified": verified,
             "error": None
         }
+        if simplified is not None:
+            result["simplified_form"] = str(simplified)
+        return result
     except Exception as e:
         return {"success": False, "error": str(e)}
 
@@ -149,7 +189,7 @@ def solve_divide_conquer(data: dict) -> dict:
     Solve divide-and-conquer recurrence: T(n) = a*T(n/b) + f(n)
     Uses Master Theorem or Akra-Bazzi.
     """
-    n = Symbol('n', positive=True, real=True)
+    n = _N_REAL
 
     a = data.get("a", 2)
     b = data.get("b", 2)
@@ -157,13 +197,12 @@ def solve_divide_conquer(data: dict) -> dict:
 
     try:
         # Use the complexity adapter for human-friendly notation
-        f_n = parse_complexity(f_n_str).subs(complexity_n, n)
+        f_n = parse_complexity(f_n_str, target_var=n)
     except Exception as e:
         return {"success": False, "error": f"Invalid f(n): {e}"}
 
     # Critical exponent: log_b(a)
-    from sympy import log as sym_log
-    critical_exp = sym_log(a, b)
+    critical_exp = log(a, b)
     critical_exp_float = float(critical_exp.evalf())
 
     # Determine f(n) growth rate
@@ -228,8 +267,8 @@ def verify_recurrence(data: dict) -> dict:
     """
     Verify that a proposed solution satisfies a recurrence.
     """
-    n = Symbol('n', integer=True, positive=True)
-    T = Function('T')
+    n = _N_INT
+    T = _T
 
     recurrence_str = data.get("recurrence", "")
     solution_str = data.get("solution", "")
@@ -237,12 +276,12 @@ def verify_recurrence(data: dict) -> dict:
 
     try:
         # Use the complexity adapter for human-friendly notation
-        solution = parse_complexity(solution_str).subs(complexity_n, n)
+        solution = parse_complexity(solution_str, target_var=n)
 
         # Convert base cases
         init_conds = {}
         for k, v in base_cases.items():
-            init_conds[T(int(k))] = sympify(v)
+            init_conds[T(int(k))] = Integer(v) if type(v) is int else sympify(v)
 
         # Verify base cases
         base_ok = True
@@ -283,7 +322,7 @@ def compare_complexities(data: dict) -> dict:
 
     Returns whether f = O(g), f = Ω(g), or f = Θ(g).
     """
-    n = Symbol('n', integer=True, positive=True)
+    n = _N_INT
 
     f_str = data.get("f", "n")
     g_str = data.get("g", "n")
@@ -291,42 +330,45 @@ def compare_complexities(data: dict) -> dict:
 
     try:
         # Use the complexity adapter for human-friendly notation
-        f = parse_complexity(f_str).subs(complexity_n, n)
-        g = parse_complexity(g_str).subs(complexity_n, n)
+        f = parse_complexity(f_str, target_var=n)
+        g = parse_complexity(g_str, target_var=n)
+
+        # lim(n→∞) f/g drives every check below; compute it once
+        lim = limit_ratio(f, g, n)
 
         # General comparison
-        comparison = compare_asymptotic(f, g, n)
+        comparison = compare_asymptotic(f, g, n, lim)
 
         # Specific bound verification
         if bound_type == "O":
-            holds, constant = verify_big_o(f, g, n)
+            holds, constant = verify_big_o(f, g, n, lim)
             return {
                 "success": True,
                 "bound_type": "O",
                 "holds": holds,
                 "constant": constant,
                 "comparison": comparison,
-                "limit_ratio": str(limit(f/g, n, oo))
+                "limit_ratio": str(lim)
             }
         elif bound_type == "Omega":
-            holds, constant = verify_big_omega(f, g, n)
+            holds, constant = verify_big_omega(f, g, n, lim)
             return {
                 "success": True,
                 "bound_type": "Omega",
                 "holds": holds,
                 "constant": constant,
                 "comparison": comparison,
-                "limit_ratio": str(limit(f/g, n, oo))
+                "limit_ratio": str(lim)
             }
         else:  # Theta
-            holds, constants = verify_big_theta(f, g, n)
+            holds, constants = verify_big_theta(f, g, n, lim)
             return {
                 "success": True,
                 "bound_type": "Theta",
                 "holds": holds,
                 "constants": constants,
                 "comparison": comparison,
-                "limit_ratio": str(limit(f/g, n, oo))
+                "limit_ratio": str(lim)
             }
 
     except Exception as e:
@@ -339,74 +381,318 @@ def extract_complexity(expr, n) -> str:
 
     Uses L'Hôpital's rule (via sympy.limit) to properly handle indeterminate forms.
     For f(n) ~ g(n), we check: lim(n→∞) f(n)/g(n) = c where 0 < c < ∞
+
+    Simple sums of c*b^n*n^k*log(n)^j terms are read off structurally;
+    otherwise the leading term comes from SymPy's Order(expr, (n, oo)), with
+    candidate limits as a last resort. Results are memoized per expression.
     """
     try:
         # Handle special cases
         if expr.is_constant():
             return "O(1)"
 
-        # Candidate complexity classes to test against (in order of growth)
-        from sympy import log as sym_log
-        candidates = [
-            (1, "O(1)"),
-            (sym_log(n), "O(log(n))"),
-            (sym_log(n)**2, "O(log^2(n))"),
-            (sqrt(n), "O(sqrt(n))"),
-            (n, "O(n)"),
-            (n * sym_log(n), "O(n*log(n))"),
-            (n * sym_log(n)**2, "O(n*log^2(n))"),
-            (n**Rational(3, 2), "O(n^(3/2))"),
-            (n**2, "O(n^2)"),
-            (n**2 * sym_log(n), "O(n^2*log(n))"),
-            (n**3, "O(n^3)"),
-            (n**4, "O(n^4)"),
-            (Rational(3, 2)**n, "O(1.5^n)"),
-            ((1 + sqrt(5))/2, "O(phi^n)"),  # Golden ratio
-            (2**n, "O(2^n)"),
-            (factorial(n), "O(n!)"),
-        ]
-
-        # For each candidate, compute limit of expr/candidate
-        # If limit is a finite positive constant, that's our complexity class
-        for candidate_expr, candidate_str in candidates:
-            try:
-                ratio = simplify(expr / candidate_expr)
-                lim = limit(ratio, n, oo)
+        # Cheap structural read of sums of c*b^n*n^k*log(n)^j terms
+        fast = _fast_classify(expr, n)
+        if fast is not None:
+            return fast
+
+        return _classify(expr, n)
 
-                # Check if limit is a finite positive constant
-                if lim.is_number and lim.is_positive and lim.is_finite:
-                    return candidate_str
+    except Exception:
+        return "O(?)"
 
-                # If limit is 0, expr grows slower than candidate - try next
-                if lim == 0:
-                    continue
 
-                # If limit is ∞, expr grows faster - keep trying larger candidates
-                if lim in (oo, zoo):
-                    continue
+def _fast_classify(expr, n) -> str | None:
+    """
+    Classify expr by inspecting its terms, without any limit computation.
+
+    Each term of the expanded expression is read as
+    c * b^n * n^k * log(n)^j (or c * n!), and the term with the largest
+    growth (factorial > exponential > polynomial*log > polynomial > log >
+    constant) decides the class. Returns None whenever the structure is not
+    recognized or the dominant growth could cancel, so the caller can fall
+    back to the limit-based classification.
+    """
+    terms = expand(expr, power_base=False, power_exp=False, log=False).as_ordered_terms()
+
+    growth: dict[tuple, Any] = {}  # (fact, base, degree, log power) -> coefficient
+    exact_base: dict[tuple, Any] = {}  # same key -> base as a SymPy number
+    for term in terms:
+        coeff = Integer(1)
+        fact, base, deg, log_pow = 0, Integer(1), Integer(0), Integer(0)
 
-            except Exception:
+        for factor in Mul.make_args(term):
+            if not factor.has(n):
+                coeff *= factor
                 continue
 
-        # Try to extract polynomial degree via limit-based approach
-        # For polynomial f(n) = n^d, lim(n→∞) f(n)/n^d = constant
-        degree = extract_degree_via_limit(expr, n)
-        if degree is not None:
-            if degree == int(degree):
-                return f"O(n^{int(degree)})"
+            b, e = factor.as_base_exp()
+            if b == n and e.is_number:
+                deg += e
+            elif b == log(n) and e.is_number:
+                log_pow += e
+            elif isinstance(b, factorial) and b.args[0] == n and e == 1:
+                fact += 1
+            elif not b.has(n):
+                # b^(c*n + d) contributes (b^c)^n * b^d
+                c = e.coeff(n)
+                d = expand(e - c * n)
+                if c.has(n) or d.has(n):
+                    return None
+                base *= b**c
+                coeff *= b**d
             else:
-                return f"O(n^{degree:.2f})"
+                return None
+
+        if fact and (base != 1 or deg != 0 or log_pow != 0):
+            return None
 
-        # Fallback: use leading term
-        from sympy import LT
         try:
-            leading = LT(expr, n)
-            return f"O({leading})"
+            key = (fact, float(base), float(deg), float(log_pow))
+        except TypeError:
+            return None
+        growth[key] = growth.get(key, 0) + coeff
+        exact_base.setdefault(key, base)
+
+    def magnitude(key):
+        return (key[0], abs(key[1]), key[2], key[3])
+
+    top = max(growth, key=magnitude)
+    if magnitude(top) == (0, 1.0, 0.0, 0.0):
+        return "O(1)"  # constants and bounded oscillation such as (-1)**n
+    if sum(1 for key in growth if magnitude(key) == magnitude(top)) > 1:
+        return None  # e.g. 2^n + (-2)^n: dominant terms may cancel
+
+    fact, base, deg, log_pow = top
+    if growth[top].is_positive is not True or base < 0:
+        return None
+    if deg < 0 or log_pow < 0:
+        return None  # e.g. n/log(n): no compact label
+    if magnitude(top) < (0, 1.0, 0.0, 0.0):
+        return None  # decays to zero; leave to the limit-based path
+
+    if fact:
+        return "O(n!)"
+
+    parts = []
+    if deg != 0:
+        k = nsimplify(deg, rational=True)
+        if k == 1:
+            parts.append("n")
+        elif k == Rational(1, 2):
+            parts.append("sqrt(n)")
+        elif k.is_Integer:
+            parts.append(f"n^{k}")
+        else:
+            parts.append(f"n^({k})")
+    if log_pow != 0:
+        j = nsimplify(log_pow, rational=True)
+        parts.append("log(n)" if j == 1 else f"log^{j}(n)")
+    if base != 1:
+        if math.isclose(base, (1 + math.sqrt(5)) / 2):
+            parts.append("phi^n")
+        elif math.isclose(base, math.e):
+            parts.append("e^n")
+        else:
+            parts.append(f"{_format_base(exact_base[top])}^n")
+
+    return f"O({'*'.join(parts) or '1'})"
+
+
+def _format_base(base) -> str:
+    """Print an exponential base for a label: 2, 0.5, sqrt(2), (4/3), ..."""
+    if base.is_Float:
+        return f"{float(base):g}"
+    if base.is_Integer or (base.is_Pow and base.exp == Rational(1, 2)):
+        return str(base)
+    return f"({base})"
+
+
+def _leading_growth(expr, n):
+    """
+    Leading asymptotic term of expr as n → ∞, without its constant factor.
+
+    Uses Order(expr, (n, oo)) on the expand_func form (so e.g. binomial(n, 2)
+    becomes a polynomial first) and, where SymPy can, rewrites the
+    exp(n*log(b)) and log(1/n) forms it produces back into b**n and log(n).
+    Float or complex exponents may stay in exp(...) form; see _is_readable_lead.
+    """
+    lead = Order(expand_func(expr), (n, oo)).expr
+    lead = powdenest(expand_log(lead, force=True), force=True)
+    return lead.as_coeff_Mul()[1]
+
+
+def _is_readable_lead(lead, n) -> bool:
+    """
+    True if an Order leading term is fit to print as the complexity label.
+
+    Only n!, log(n) and iterated logs such as log(log(n)) may appear. Leads
+    that still contain exp(...), I, other functions, or log/factorial of
+    anything else (e.g. harmonic(n) or log(n!) handed back unchanged) are
+    left to the candidate-limit fallback instead.
+    """
+    if lead.has(I):
+        return False
+    for f in lead.atoms(Function):
+        arg = f.args[0]
+        if isinstance(f, factorial) and arg == n:
+            continue
+        if isinstance(f, log) and (arg == n or isinstance(arg, log)):
+            continue
+        return False
+    return True
+
+
+@lru_cache(maxsize=None)
+def _candidate_classes(n) -> tuple:
+    """Candidate complexity classes to test against (in order of growth)."""
+    return (
+        (1, "O(1)"),
+        (log(n), "O(log(n))"),
+        (log(n)**2, "O(log^2(n))"),
+        (sqrt(n), "O(sqrt(n))"),
+        (n, "O(n)"),
+        (n * log(n), "O(n*log(n))"),
+        (n * log(n)**2, "O(n*log^2(n))"),
+        (n**Rational(3, 2), "O(n^(3/2))"),
+        (n**2, "O(n^2)"),
+        (n**2 * log(n), "O(n^2*log(n))"),
+        (n**3, "O(n^3)"),
+        (n**4, "O(n^4)"),
+        (Rational(3, 2)**n, "O(1.5^n)"),
+        ((1 + sqrt(5))/2, "O(phi^n)"),  # Golden ratio
+        (2**n, "O(2^n)"),
+        (factorial(n), "O(n!)"),
+    )
+
+
+@lru_cache(maxsize=512)
+def _classify(expr, n) -> str:
+    """
+    Classify expr via its leading term, falling back to candidate classes.
+
+    Memoized on the Expr itself: SymPy caches Basic.__hash__, so repeat
+    lookups neither rebuild a string key nor re-walk the tree.
+    """
+    # Let SymPy find the leading asymptotic term directly
+    try:
+        lead = _leading_growth(expr, n)
+        label = _fast_classify(lead, n)
+        if label is not None:
+            return label
+        if lead.has(I) and not Abs(lead).has(n):
+            return "O(1)"  # bounded oscillation, e.g. (-1)**n -> exp(I*pi*n)
+        if _is_readable_lead(lead, n):
+            return f"O({lead})"
+    except Exception:
+        pass
+
+    # Fall back to testing candidates: compute limit of expr/candidate
+    # If limit is a finite positive constant, that's our complexity class
+    label = _match_candidate_class(expr, n)
+    if label is not None:
+        return label
+
+    # Try to extract polynomial degree via limit-based approach
+    # For polynomial f(n) = n^d, lim(n→∞) f(n)/n^d = constant
+    degree = extract_degree_via_limit(expr, n)
+    if degree is not None:
+        if degree == int(degree):
+            return f"O(n^{int(degree)})"
+        else:
+            return f"O(n^{degree:.2f})"
+
+    # Fallback: use leading term
+    from sympy import LT
+    try:
+        leading = LT(expr, n)
+        return f"O({leading})"
+    except Exception:
+        return f"O({expr})"
+
+
+def _match_candidate_class(expr, n) -> str | None:
+    """
+    First candidate class c (in growth order) with 0 < lim expr/c < ∞.
+
+    Set RECURRENCE_SOLVER_WORKERS to more than 1 to evaluate the candidate
+    limits in a process pool; otherwise they run sequentially and stop at
+    the first match.
+    """
+    candidates = _candidate_classes(n)
+
+    if _LIMIT_WORKERS > 1:
+        try:
+            pool = _get_limit_pool()
+            expr_srepr, n_srepr = srepr(expr), srepr(n)
+            futures = [
+                pool.submit(_limit_job, expr_srepr, srepr(candidate_expr), n_srepr)
+                for candidate_expr, _ in candidates
+            ]
+            try:
+                for future, (_, candidate_str) in zip(futures, candidates):
+                    if future.result():
+                        return candidate_str
+                return None
+            finally:
+                # Limits still queued or running after an early match would
+                # tie up the workers, so retire this pool and start afresh
+                if not all(future.done() for future in futures):
+                    _shutdown_limit_pool()
         except Exception:
-            return f"O({expr})"
+            pass  # pool unavailable or broken; fall back to the sequential loop
+
+    for candidate_expr, candidate_str in candidates:
+        if _has_growth_of(expr, candidate_expr, n):
+            return candidate_str
+    return None
 
+
+def _has_growth_of(expr, candidate_expr, n) -> bool:
+    """True if lim(n→∞) expr/candidate is a finite positive constant."""
+    try:
+        lim = limit(growth_ratio(expr, candidate_expr), n, oo)
+        return bool(lim.is_number and lim.is_positive and lim.is_finite)
     except Exception:
-        return "O(?)"
+        return False
+
+
+def _limit_job(expr_srepr: str, candidate_srepr: str, n_srepr: str) -> bool:
+    """Process-pool entry point for _has_growth_of; arguments travel as srepr."""
+    return _has_growth_of(
+        sympify(expr_srepr), sympify(candidate_srepr), sympify(n_srepr)
+    )
+
+
+def _get_limit_pool():
+    """Create the candidate-limit process pool on first use."""
+    global _limit_pool
+    if _limit_pool is None:
+        from concurrent.futures import ProcessPoolExecutor
+        _limit_pool = ProcessPoolExecutor(max_workers=_LIMIT_WORKERS)
+    return _limit_pool
+
+
+@atexit.register
+def _shutdown_limit_pool():
+    """
+    Drop the candidate-limit pool without waiting for it.
+
+    Queued limits are cancelled; workers still inside a limit are terminated,
+    since shutdown() alone would let them run on and hold up interpreter exit.
+    """
+    global _limit_pool
+    pool, _limit_pool = _limit_pool, None
+    if pool is None:
+        return
+    terminate_workers = getattr(pool, "terminate_workers", None)  # Python 3.14+
+    if terminate_workers is not None:
+        terminate_workers()
+        return
+    processes = list((getattr(pool, "_processes", None) or {}).values())
+    pool.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
 
 
 def extract_degree_via_limit(expr, n) -> float | None:
@@ -417,10 +703,8 @@ def extract_degree_via_limit(expr, n) -> float | None:
     We find d by checking: lim(n→∞) log(f(n))/log(n) = d
     """
     try:
-        from sympy import log as sym_log
-
         # For polynomial f(n) ~ n^d: log(f)/log(n) → d as n → ∞
-        log_ratio = simplify(sym_log(Abs(expr)) / sym_log(n))
+        log_ratio = simplify(log(Abs(expr)) / log(n))
         degree_limit = limit(log_ratio, n, oo)
 
         if degree_limit.is_number and degree_limit.is_finite:
@@ -431,7 +715,22 @@ def extract_degree_via_limit(expr, n) -> float | None:
         return None
 
 
-def compare_asymptotic(f, g, n) -> str:
+def growth_ratio(f, g):
+    """
+    Normalize f/g for limit().
+
+    cancel() plus exponent combining is enough for ratios of polynomial,
+    log and exponential terms, and far cheaper than a full simplify().
+    """
+    return powsimp(cancel(f / g), combine='exp')
+
+
+def limit_ratio(f, g, n):
+    """Compute lim(n→∞) f(n)/g(n), the quantity every bound check is based on."""
+    return limit(growth_ratio(f, g), n, oo)
+
+
+def compare_asymptotic(f, g, n, lim=None) -> str:
     """
     Compare asymptotic growth of f(n) vs g(n) using limits.
 
@@ -442,10 +741,11 @@ def compare_asymptotic(f, g, n) -> str:
         "?"      if undetermined
 
     Uses L'Hôpital's rule internally via sympy.limit().
+    Pass lim to reuse an already computed limit_ratio(f, g, n).
     """
     try:
-        ratio = simplify(f / g)
-        lim = limit(ratio, n, oo)
+        if lim is None:
+            lim = limit_ratio(f, g, n)
 
         if lim == 0:
             return "f < g"  # f = o(g)
@@ -455,7 +755,7 @@ def compare_asymptotic(f, g, n) -> str:
             return "f ~ g"  # f = Θ(g)
         else:
             # Try the other direction
-            inv_ratio = simplify(g / f)
+            inv_ratio = growth_ratio(g, f)
             inv_lim = limit(inv_ratio, n, oo)
             if inv_lim == 0:
                 return "f > g"
@@ -467,7 +767,7 @@ def compare_asymptotic(f, g, n) -> str:
         return "?"
 
 
-def verify_big_o(f, g, n) -> tuple[bool, float | None]:
+def verify_big_o(f, g, n, lim=None) -> tuple[bool, float | None]:
     """
     Verify that f(n) = O(g(n)).
 
@@ -475,10 +775,11 @@ def verify_big_o(f, g, n) -> tuple[bool, float | None]:
     Returns (False, None) otherwise.
 
     Uses: f = O(g) iff lim sup(f/g) < ∞
+    Pass lim to reuse an already computed limit_ratio(f, g, n).
     """
     try:
-        ratio = simplify(f / g)
-        lim = limit(ratio, n, oo)
+        if lim is None:
+            lim = limit_ratio(f, g, n)
 
         if lim.is_number and lim.is_finite and lim.is_nonnegative:
             return (True, float(lim) if lim != 0 else 0.0)
@@ -490,7 +791,7 @@ def verify_big_o(f, g, n) -> tuple[bool, float | None]:
         return (False, None)
 
 
-def verify_big_omega(f, g, n) -> tuple[bool, float | None]:
+def verify_big_omega(f, g, n, lim=None) -> tuple[bool, float | None]:
     """
     Verify that f(n) = Ω(g(n)).
 
@@ -498,10 +799,11 @@ def verify_big_omega(f, g, n) -> tuple[bool, float | None]:
     Returns (False, None) otherwise.
 
     Uses: f = Ω(g) iff lim inf(f/g) > 0
+    Pass lim to reuse an already computed limit_ratio(f, g, n).
     """
     try:
-        ratio = simplify(f / g)
-        lim = limit(ratio, n, oo)
+        if lim is None:
+            lim = limit_ratio(f, g, n)
 
         if lim in (oo, zoo):
             return (True, float('inf'))  # f = ω(g) implies f = Ω(g)
@@ -513,7 +815,7 @@ def verify_big_omega(f, g, n) -> tuple[bool, float | None]:
         return (False, None)
 
 
-def verify_big_theta(f, g, n) -> tuple[bool, tuple[float, float] | None]:
+def verify_big_theta(f, g, n, lim=None) -> tuple[bool, tuple[float, float] | None]:
     """
     Verify that f(n) = Θ(g(n)).
 
@@ -521,10 +823,11 @@ def verify_big_theta(f, g, n) -> tuple[bool, tuple[float, float] | None]:
     Returns (False, None) otherwise.
 
     Uses: f = Θ(g) iff lim(f/g) = c where 0 < c < ∞
+    Pass lim to reuse an already computed limit_ratio(f, g, n).
     """
     try:
-        ratio = simplify(f / g)
-        lim = limit(ratio, n, oo)
+        if lim is None:
+            lim = limit_ratio(f, g, n)
 
         if lim.is_number and lim.is_positive and lim.is_finite:
             c = float(lim)
@@ -537,76 +840,153 @@ def verify_big_theta(f, g, n) -> tuple[bool, tuple[float, float] | None]:
 
 
 def get_polynomial_degree(expr, n) -> float | None:
-    """Get the degree if expr is polynomial in n, else None."""
+    """
+    Get the degree if expr is polynomial in n, else None.
+
+    Sums of c * n^k * log(n)^j terms (integer j ≥ 0) report the degree k of
+    their dominant term. Other shapes (floor(n/2), n^2/(n+1), ...) report
+    d = extract_degree_via_limit only if expr = Theta(n^d); n/log(n),
+    n*log(log(n)) and the like return None so callers fall back to
+    Akra-Bazzi rather than misapply the Master Theorem.
+    """
     try:
         from sympy import Poly, degree as poly_degree
         if expr.is_polynomial(n):
             p = Poly(expr, n)
             return float(poly_degree(p, n))
 
-        # Try to get effective degree via limit
-        # degree d means limit of expr/n^d is constant and nonzero
-        for d in [0, 0.5, 1, 1.5, 2, 2.5, 3, 4, 5]:
-            ratio = limit(expr / n**d, n, oo)
-            if ratio not in (0, oo, -oo, zoo, nan) and ratio.is_constant():
-                return d
+        shape = _dominant_power_log(expr, n)
+        if shape is not None:
+            return float(shape[0])
 
-        return None
+        degree = extract_degree_via_limit(expr, n)
+        if degree is None:
+            return None
+        lim = limit(expr / n**nsimplify(degree, rational=True), n, oo)
+        return degree if lim.is_positive and lim.is_finite else None
     except Exception:
         return None
 
 
 def get_log_power(expr, n) -> int:
-    """Get the power of log(n) in expr, or 0 if none."""
+    """
+    Get the power j of log(n) in the dominant c * n^k * log(n)^j term of expr.
+
+    Returns 0 if there is none, including shapes get_polynomial_degree
+    rejects such as 1/log(n) or log(log(n)).
+    """
     try:
-        from sympy import log as sym_log
-        # Simple check: count log factors
-        if not expr.has(sym_log):
+        if not expr.has(log):
             return 0
-
-        # This is a simplified heuristic
-        expr_str = str(expr)
-        if "log(n)**" in expr_str:
-            # Try to extract power
-            import re
-            match = re.search(r"log\(n\)\*\*(\d+)", expr_str)
-            if match:
-                return int(match.group(1))
-        if "log(n)" in expr_str:
-            return 1
-        return 0
+        shape = _dominant_power_log(expr, n)
+        return shape[1] if shape is not None else 0
     except Exception:
         return 0
 
 
-def verify_solution_numerically(solution, n, recurrence_eq, T, init_conds) -> bool:
-    """Verify solution by substituting into recurrence for several n values."""
+def _dominant_power_log(expr, n) -> tuple | None:
+    """
+    (k, j) of the fastest-growing term if expr is a sum of c * n^k * log(n)^j
+    terms with numeric k and integer j ≥ 0, else None.
+    """
+    log_n = log(n)
+    shapes = []
+    for term in expand(expr, power_base=False, power_exp=False, log=False).as_ordered_terms():
+        deg, log_pow = Integer(0), 0
+        for factor in Mul.make_args(term):
+            if not factor.has(n):
+                continue
+            b, e = factor.as_base_exp()
+            if b == n and e.is_number:
+                deg += e
+            elif b == log_n and e.is_Integer and e.is_positive:
+                log_pow += int(e)
+            else:
+                return None
+        shapes.append((deg, log_pow))
+
+    if not shapes:
+        return None
+    return max(shapes, key=lambda shape: (float(shape[0]), shape[1]))
+
+
+def verify_solution_numerically(solution, n, coeffs, f_n, init_conds) -> bool:
+    """
+    Verify solution by evaluating the recurrence residual at several n values.
+
+    The closed form and f(n) are compiled once with lambdify, so each check is
+    float arithmetic rather than subs+simplify. With NumPy installed all test
+    points are evaluated in one vectorized pass. Closed forms lambdify cannot
+    evaluate (harmonic(n), fibonacci(n), ...) are checked by substitution.
+    """
     try:
         # Get order of recurrence
         order = len(init_conds)
 
-        for test_n in range(order + 1, order + 10):
-            # Substitute solution into recurrence
-            check = recurrence_eq
-
-            # Replace T(n), T(n-1), etc. with solution values
-            for offset in range(order + 1):
-                t_val = solution.subs(n, test_n - offset)
-                check = check.subs(T(n - offset), t_val)
-            check = check.subs(n, test_n)
-
-            result = simplify(check)
-            if result != 0:
-                # Try numerical evaluation
-                result_float = complex(N(result))
-                if abs(result_float) > 1e-10:
+        try:
+            return _verify_residual_vectorized(solution, n, coeffs, f_n, order)
+        except ImportError:
+            pass  # NumPy not installed; use the scalar path
+        except Exception:
+            pass  # e.g. functions NumPy cannot evaluate; use the scalar path
+
+        try:
+            sol_fn = lambdify(n, solution, modules="math", cse=True)
+            f_fn = lambdify(n, f_n, modules="math", cse=True)
+
+            for test_n in range(order + 1, order + 10):
+                # T(n) - sum(c_i * T(n-1-i)) - f(n) should vanish
+                lhs = sol_fn(test_n)
+                rhs = f_fn(test_n) + sum(
+                    c * sol_fn(test_n - 1 - i) for i, c in enumerate(coeffs)
+                )
+                if abs(lhs - rhs) > 1e-10 * max(1.0, abs(lhs)):
                     return False
 
-        return True
+            return True
+        except Exception:
+            pass  # no math translation for some function; substitute instead
+
+        return _verify_residual_symbolic(solution, n, coeffs, f_n, order)
     except Exception:
         return False
 
 
+def _verify_residual_vectorized(solution, n, coeffs, f_n, order) -> bool:
+    """Residual check of verify_solution_numerically over a NumPy array of n."""
+    # Imported here so CLI calls that never verify don't pay NumPy's import time
+    import numpy as np
+
+    # Float test points: integer arrays reject negative powers such as 2**(-n)
+    test_ns = np.arange(order + 1, order + 10, dtype=float)
+    sol_fn = lambdify(n, solution, modules="numpy", cse=True)
+    f_fn = lambdify(n, f_n, modules="numpy", cse=True)
+
+    # Row k holds T(n - k) at every test point
+    t_vals = np.stack([
+        np.broadcast_to(sol_fn(test_ns - k), test_ns.shape)
+        for k in range(len(coeffs) + 1)
+    ])
+    residual = t_vals[0] - f_fn(test_ns) - sum(
+        c * t_vals[i + 1] for i, c in enumerate(coeffs)
+    )
+    tolerance = 1e-10 * np.maximum(1.0, np.abs(t_vals[0]))
+    return bool(np.all(np.abs(residual) <= tolerance))
+
+
+def _verify_residual_symbolic(solution, n, coeffs, f_n, order) -> bool:
+    """Residual check of verify_solution_numerically by subs+simplify."""
+    for test_n in range(order + 1, order + 10):
+        residual = simplify(
+            solution.subs(n, test_n) - f_n.subs(n, test_n) - sum(
+                c * solution.subs(n, test_n - 1 - i) for i, c in enumerate(coeffs)
+            )
+        )
+        if residual != 0 and abs(complex(residual.evalf())) > 1e-10:
+            return False
+    return True
+
+
 def evaluate_akra_bazzi_integral(data: dict) -> dict:
     """
     Evaluate the Akra-Bazzi integral: ∫₁ⁿ g(u)/u^(p+1) du
@@ -630,13 +1010,7 @@ def evaluate_akra_bazzi_integral(data: dict) -> dict:
             "method": "closed_form" | "asymptotic" | "series"
         }
     """
-    from sympy import (
-        integrate, log as sym_log, exp as sym_exp, gamma,
-        series, O as BigO_sympy, polylog, uppergamma, lowergamma,
-        hyperexpand, meijerg, hyper, LambertW, Ei, erf, erfc,
-        erfi, fresnels, fresnelc, Si, Ci, Shi, Chi, li, dirichlet_eta,
-        zeta, lerchphi, jacobi, chebyshevt, chebyshevu, legendre, assoc_legendre
-    )
+    from sympy import integrate, latex
 
     g_str = data.get("g", "1")
     p = data.get("p", 1.0)
@@ -648,7 +1022,7 @@ def evaluate_akra_bazzi_integral(data: dict) -> dict:
 
     try:
         # Parse g(n) and substitute u for n
-        g_n = parse_complexity(g_str).subs(complexity_n, n)
+        g_n = parse_complexity(g_str, target_var=n)
         g_u = g_n.subs(n, u)
 
         # Build the integrand: g(u) / u^(p+1)
@@ -754,8 +1128,6 @@ def estimate_integral_asymptotic(g_n, n, p: float):
     - If g(n) = n^k * log^j(n), similar but with log factors
     - If g(n) = b^n (exponential), integral ~ b^n / n^(p+1) (exponential dominates)
     """
-    from sympy import log as sym_log, exp as sym_exp, Pow
-
     # Check for exponential form: b^n
     g_str = str(g_n)
     if "**" in g_str and g_str.endswith("**n") or ("**n" in g_str):
@@ -792,24 +1164,50 @@ def estimate_integral_asymptotic(g_n, n, p: float):
 
         if abs(diff) < epsilon:
             # k ≈ p: integral ~ log^(j+1)(n)
-            return sym_log(n)**(log_power + 1)
+            return log(n)**(log_power + 1)
         elif diff < 0:
             # k < p: integral converges to O(1)
             return sympify(1)
         else:
             # k > p: integral ~ n^(k-p) * log^j(n)
             if log_power > 0:
-                return n**diff * sym_log(n)**log_power
+                return n**diff * log(n)**log_power
             else:
                 return n**diff
     else:
         # Check if g contains log factors but we couldn't determine polynomial degree
-        if g_n.has(sym_log):
+        if g_n.has(log):
             # Likely polylog form - use log^2(n) as conservative estimate
-            return sym_log(n)**2
+            return log(n)**2
 
         # Unknown form - return symbolic placeholder
-        return sym_log(n)  # Conservative estimate
+        return log(n)  # Conservative estimate
+
+
+def _result_cache_path(input_data: dict) -> Path | None:
+    """
+    Location of the on-disk cache entry for a request, or None if disabled.
+
+    The key covers the canonical JSON of the request plus the source of this
+    script and the adapter, so editing either invalidates old entries.
+    """
+    if os.environ.get("RECURRENCE_SOLVER_NO_CACHE"):
+        return None
+
+    try:
+        digest = hashlib.sha256(
+            json.dumps(input_data, sort_keys=True, default=str).encode()
+        )
+        here = Path(__file__).parent
+        for source in ("recurrence_solver.py", "complexity_adapter.py"):
+            source_path = here / source
+            if source_path.exists():
+                digest.update(source_path.read_bytes())
+    except (OSError, TypeError, ValueError):
+        return None
+
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "recurrence_solver" / f"{digest.hexdigest()}.json"
 
 
 def main():
@@ -820,6 +1218,14 @@ def main():
         print(json.dumps({"success": False, "error": f"Invalid JSON: {e}"}))
         sys.exit(1)
 
+    cache_path = _result_cache_path(input_data)
+    if cache_path is not None:
+        try:
+            print(cache_path.read_text())
+            return
+        except OSError:
+            pass
+
     request_type = input_data.get("type", "linear")
 
     if request_type == "linear":
@@ -835,7 +1241,18 @@ def main():
     else:
         result = {"success": False, "error": f"Unknown type: {request_type}"}
 
-    print(json.dumps(result, indent=2, default=str))
+    output = json.dumps(result, indent=2, default=str)
+    print(output)
+
+    # Only successful results are cached; failures may be transient
+    if cache_path is not None and result.get("success"):
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(output)
+            tmp_path.replace(cache_path)
+        except OSError:
+            pass
 
 
 if __name__ == "__main__":